@@ -73,6 +73,11 @@ struct SignTransactionRequest {
     signature: String, // All signers must provide their signature
 }
 
+#[derive(Debug, Serialize, Deserialize)]
+struct SignTransactionBatchRequest {
+    signatures: Vec<SignTransactionRequest>,
+}
+
 #[derive(Debug, Serialize, Deserialize)]
 struct TransactionInfoResponse {
     tx_id: String,
@@ -173,6 +178,10 @@ async fn main() -> anyhow::Result<()> {
         .route("/api/v1/transactions", post(create_transaction))
         .route("/api/v1/transactions/{tx_id}", get(get_transaction))
         .route("/api/v1/transactions/{tx_id}/sign", post(sign_transaction))
+        .route(
+            "/api/v1/transactions/{tx_id}/sign_batch",
+            post(sign_transaction_batch),
+        )
         .route(
             "/api/v1/transactions/{tx_id}/execute",
             post(execute_transaction),
@@ -311,25 +320,10 @@ async fn get_transaction(
     let signatures: Vec<SignatureInfo> = tx_state
         .signatures
         .iter()
-        .map(|sig| {
-            let signer_type = if sig.signer == state.signer_addresses.human1
-                || sig.signer == state.signer_addresses.human2
-            {
-                "Human"
-            } else if sig.signer == state.signer_addresses.ai_cfo
-                || sig.signer == state.signer_addresses.ai_security
-                || sig.signer == state.signer_addresses.ai_analyst
-            {
-                "AI Agent"
-            } else {
-                "Unknown"
-            };
-
-            SignatureInfo {
-                signer: sig.signer.to_string(),
-                signer_type: signer_type.to_string(),
-                signed_at: chrono::Utc::now().to_rfc3339(),
-            }
+        .map(|sig| SignatureInfo {
+            signer: sig.signer.to_string(),
+            signer_type: signer_type(&state.signer_addresses, sig.signer).to_string(),
+            signed_at: chrono::Utc::now().to_rfc3339(),
         })
         .collect();
 
@@ -380,29 +374,114 @@ async fn sign_transaction(
         tx_state.status = TransactionStatus::ReadyToExecute;
     }
 
-    // Determine signer type based on known addresses
-    let signer_type = if signer_addr == state.signer_addresses.human1
-        || signer_addr == state.signer_addresses.human2
-    {
-        "Human"
-    } else if signer_addr == state.signer_addresses.ai_cfo
-        || signer_addr == state.signer_addresses.ai_security
-        || signer_addr == state.signer_addresses.ai_analyst
-    {
-        "AI Agent"
-    } else {
-        "Unknown"
-    };
+    // Include the full status so clients don't need a follow-up status request
+    Ok(Json(serde_json::json!({
+        "success": true,
+        "signer_type": signer_type(&state.signer_addresses, signer_addr),
+        "current_signatures": tx_state.signatures.len(),
+        "required_signatures": 4,
+        "ready_to_execute": tx_state.signatures.len() >= 4,
+        "status": tx_state.status,
+        "signatures_collected": tx_state.signatures.len(),
+        "signers": signers_json(&state.signer_addresses, tx_state)
+    })))
+}
+
+async fn sign_transaction_batch(
+    State(state): State<Arc<AppState>>,
+    Path(tx_id): Path<String>,
+    Json(req): Json<SignTransactionBatchRequest>,
+) -> Result<Json<serde_json::Value>, StatusCode> {
+    // Decode every entry up front so a malformed one rejects the whole batch
+    let entries = req
+        .signatures
+        .iter()
+        .map(|entry| {
+            let signer_addr =
+                Address::from_str(&entry.signer_address).map_err(|_| StatusCode::BAD_REQUEST)?;
+            let signature = hex::decode(entry.signature.trim_start_matches("0x"))
+                .map(Bytes::from)
+                .map_err(|_| StatusCode::BAD_REQUEST)?;
+            Ok((signer_addr, signature))
+        })
+        .collect::<Result<Vec<_>, StatusCode>>()?;
+
+    let mut txs = state.transactions.write().await;
+    let tx_state = txs.get_mut(&tx_id).ok_or(StatusCode::NOT_FOUND)?;
+
+    let mut results = Vec::with_capacity(entries.len());
+    for (signer_addr, signature) in entries {
+        // Check if already signed
+        if tx_state.signatures.iter().any(|s| s.signer == signer_addr) {
+            results.push(serde_json::json!({
+                "signer_address": signer_addr.to_string(),
+                "error": "Already signed by this address"
+            }));
+            continue;
+        }
+
+        info!("Signer {} provided signature (batch)", signer_addr);
+
+        tx_state.signatures.push(Signature {
+            signer: signer_addr,
+            signature,
+        });
+
+        results.push(serde_json::json!({
+            "signer_address": signer_addr.to_string(),
+            "success": true,
+            "signer_type": signer_type(&state.signer_addresses, signer_addr)
+        }));
+    }
+
+    // Update status if we have enough signatures
+    if tx_state.signatures.len() >= 4 {
+        tx_state.status = TransactionStatus::ReadyToExecute;
+    }
 
     Ok(Json(serde_json::json!({
         "success": true,
-        "signer_type": signer_type,
+        "results": results,
         "current_signatures": tx_state.signatures.len(),
         "required_signatures": 4,
-        "ready_to_execute": tx_state.signatures.len() >= 4
+        "ready_to_execute": tx_state.signatures.len() >= 4,
+        "status": tx_state.status,
+        "signatures_collected": tx_state.signatures.len(),
+        "signers": signers_json(&state.signer_addresses, tx_state)
     })))
 }
 
+/// Determine signer type based on known addresses
+fn signer_type(signer_addresses: &SignerAddresses, signer: Address) -> &'static str {
+    if signer == signer_addresses.human1 || signer == signer_addresses.human2 {
+        "Human"
+    } else if signer == signer_addresses.ai_cfo
+        || signer == signer_addresses.ai_security
+        || signer == signer_addresses.ai_analyst
+    {
+        "AI Agent"
+    } else {
+        "Unknown"
+    }
+}
+
+/// Describe the signers of a transaction as reported by the status endpoint
+fn signers_json(
+    signer_addresses: &SignerAddresses,
+    tx_state: &TransactionState,
+) -> Vec<serde_json::Value> {
+    tx_state
+        .signatures
+        .iter()
+        .map(|s| {
+            serde_json::json!({
+                "address": s.signer.to_string(),
+                "type": signer_type(signer_addresses, s.signer)
+            })
+        })
+        .collect()
+}
+
 async fn execute_transaction(
     State(state): State<Arc<AppState>>,
     Path(tx_id): Path<String>,
@@ -424,19 +503,12 @@ async fn execute_transaction(
 
     // Log who signed
     for (i, sig) in tx_state.signatures.iter().enumerate() {
-        let signer_type = if sig.signer == state.signer_addresses.human1
-            || sig.signer == state.signer_addresses.human2
-        {
-            "Human"
-        } else if sig.signer == state.signer_addresses.ai_cfo
-            || sig.signer == state.signer_addresses.ai_security
-            || sig.signer == state.signer_addresses.ai_analyst
-        {
-            "AI Agent"
-        } else {
-            "Unknown"
-        };
-        info!("  Signature {}: {} ({})", i + 1, sig.signer, signer_type);
+        info!(
+            "  Signature {}: {} ({})",
+            i + 1,
+            sig.signer,
+            signer_type(&state.signer_addresses, sig.signer)
+        );
     }
 
     // Execute transaction on blockchain
@@ -480,36 +552,12 @@ async fn get_transaction_status(
     let txs = state.transactions.read().await;
     let tx_state = txs.get(&tx_id).ok_or(StatusCode::NOT_FOUND)?;
 
-    let signers: Vec<serde_json::Value> = tx_state
-        .signatures
-        .iter()
-        .map(|s| {
-            let signer_type = if s.signer == state.signer_addresses.human1
-                || s.signer == state.signer_addresses.human2
-            {
-                "Human"
-            } else if s.signer == state.signer_addresses.ai_cfo
-                || s.signer == state.signer_addresses.ai_security
-                || s.signer == state.signer_addresses.ai_analyst
-            {
-                "AI Agent"
-            } else {
-                "Unknown"
-            };
-
-            serde_json::json!({
-                "address": s.signer.to_string(),
-                "type": signer_type
-            })
-        })
-        .collect();
-
     Ok(Json(serde_json::json!({
         "tx_id": tx_id,
         "status": tx_state.status,
         "signatures_collected": tx_state.signatures.len(),
         "required_signatures": 4,
-        "signers": signers
+        "signers": signers_json(&state.signer_addresses, tx_state)
     })))
 }
 
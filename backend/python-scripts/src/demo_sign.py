@@ -10,96 +10,175 @@ In production:
 - Private keys would NEVER be in the same place
 """
 
+import argparse
+import asyncio
+import atexit
+import functools
+import logging
 import os
+import sys
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import aiohttp
 import requests
 from dotenv import load_dotenv
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    # Optional libsecp256k1 binding for faster signing
+    import coincurve
+except ImportError:
+    coincurve = None
+
+try:
+    # Optional C JSON parser for response bodies
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional libuv event loop for the async signing path
+    import uvloop
+except ImportError:
+    uvloop = None
+
+log = logging.getLogger(__name__)
+
+# Signer display name, private key env var, and signer type
+SIGNER_SPECS = [
+    ("Human 1", "HUMAN1_PRIVATE_KEY", "human"),
+    ("AI CFO", "AI_CFO_PRIVATE_KEY", "ai_agent"),
+    ("AI Security", "AI_SECURITY_PRIVATE_KEY", "ai_agent"),
+    ("AI Analyst", "AI_ANALYST_PRIVATE_KEY", "ai_agent"),
+    ("Human 2", "HUMAN2_PRIVATE_KEY", "human"),
+]
+
+
+@dataclass(slots=True, frozen=True)
+class Signer:
+    """A demo signer with its account derived once at load time"""
+
+    name: str
+    address: str
+    private_key: str
+    type: str
+    account: LocalAccount
+
+
+@functools.lru_cache(maxsize=256)
+def _account_for(private_key: str) -> LocalAccount:
+    """Derive the account for a private key, reusing earlier derivations"""
+    return Account.from_key(private_key)
+
+
+# Minimum number of signers needed to reach the 4-of-5 threshold
+MIN_SIGNERS = 4
 
 
 # Load private keys from environment variables
-def load_signers() -> Dict[str, Dict[str, str]]:
-    """Load signer information from environment variables"""
-    signers = {}
-
-    # Human signers
-    if os.getenv("HUMAN1_PRIVATE_KEY"):
-        account = Account.from_key(os.getenv("HUMAN1_PRIVATE_KEY"))
-        signers["Human 1"] = {
-            "address": account.address,
-            "private_key": os.getenv("HUMAN1_PRIVATE_KEY"),
-            "type": "human",
-        }
-
-    # AI Agent signers
-    if os.getenv("AI_CFO_PRIVATE_KEY"):
-        account = Account.from_key(os.getenv("AI_CFO_PRIVATE_KEY"))
-        signers["AI CFO"] = {
-            "address": account.address,
-            "private_key": os.getenv("AI_CFO_PRIVATE_KEY"),
-            "type": "ai_agent",
-        }
-
-    if os.getenv("AI_SECURITY_PRIVATE_KEY"):
-        account = Account.from_key(os.getenv("AI_SECURITY_PRIVATE_KEY"))
-        signers["AI Security"] = {
-            "address": account.address,
-            "private_key": os.getenv("AI_SECURITY_PRIVATE_KEY"),
-            "type": "ai_agent",
-        }
-
-    if os.getenv("AI_ANALYST_PRIVATE_KEY"):
-        account = Account.from_key(os.getenv("AI_ANALYST_PRIVATE_KEY"))
-        signers["AI Analyst"] = {
-            "address": account.address,
-            "private_key": os.getenv("AI_ANALYST_PRIVATE_KEY"),
-            "type": "ai_agent",
-        }
-
-    if os.getenv("HUMAN2_PRIVATE_KEY"):
-        account = Account.from_key(os.getenv("HUMAN2_PRIVATE_KEY"))
-        signers["Human 2"] = {
-            "address": account.address,
-            "private_key": os.getenv("HUMAN2_PRIVATE_KEY"),
-            "type": "human",
-        }
-
-    return signers
-
-
-# Load signers from environment
-DEMO_SIGNERS = load_signers()
+def load_signers() -> Tuple[Signer, ...]:
+    """Load signer information from environment variables, exiting if too few are usable"""
+    signers = []
+    problems = []
+
+    for name, env_key, kind in SIGNER_SPECS:
+        private_key = os.getenv(env_key)
+        if not private_key:
+            problems.append(f"{env_key} is not set")
+            continue
+
+        try:
+            account = _account_for(private_key)
+        except ValueError as e:
+            problems.append(f"{env_key} is invalid: {e}")
+            continue
+
+        signers.append(Signer(name, account.address, private_key, kind, account))
+
+    # Fail before any request is made rather than after creating a transaction
+    if len(signers) < MIN_SIGNERS:
+        lines = [
+            f"❌ Error: Need at least {MIN_SIGNERS} signers, but only {len(signers)} found",
+            *(f"   - {problem}" for problem in problems),
+            "",
+            "Please create a .env file with the following keys:",
+            *(f"  {env_key}=0x..." for _, env_key, _ in SIGNER_SPECS),
+            "",
+            "For testing, you can use test keys from Hardhat/Anvil",
+        ]
+        raise SystemExit("\n".join(lines))
+
+    return tuple(signers)
+
+
+@functools.lru_cache(maxsize=1)
+def _bootstrap() -> Tuple[Signer, ...]:
+    """Load the .env file and signers once; call _bootstrap.cache_clear() to reload"""
+    load_dotenv(override=False)
+    return load_signers()
+
 
 API_URL = "http://localhost:3001/api/v1"
 
+DEFAULT_RECIPIENT = "0x6f512E3F002065813B92009C74E3a7966e7F87E1"
+DEFAULT_AMOUNT = "0.001"
+
+# Transient orchestrator responses worth retrying
+RETRY_STATUSES = (502, 503, 504)
+
+# Defaults for the non-interactive submission of large signer sets
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 100
+
+# Fields a sign response needs to stand in for a status request
+STATUS_KEYS = ("signatures_collected", "required_signatures", "status", "signers")
 
-def create_transaction() -> Dict[str, Any]:
-    """Create a new transaction proposal interactively"""
+# Shared HTTP session so every orchestrator call reuses a keep-alive connection
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=len(SIGNER_SPECS),
+    max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=RETRY_STATUSES),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+atexit.register(SESSION.close)
+
+
+def prompt_transaction_details(interactive: bool = True) -> Tuple[str, str]:
+    """Ask for recipient and amount, or use the defaults when non-interactive"""
     print("\n" + "=" * 60)
     print("💼 Create New Transaction")
     print("=" * 60)
 
-    # Get recipient address
-    print("\n📮 Enter recipient address")
-    print("   (Press Enter for default: 0x6f512E3F002065813B92009C74E3a7966e7F87E1)")
-    print("   > ", end="")
-    to_address = input().strip()
-    if not to_address:
-        to_address = "0x6f512E3F002065813B92009C74E3a7966e7F87E1"
-
-    # Get amount
-    print("\n💰 Enter amount of KAIA to send")
-    print("   (Press Enter for default: 0.001 KAIA)")
-    print("   > ", end="")
-    amount_str = input().strip()
-    if not amount_str:
-        amount_str = "0.001"
+    to_address = DEFAULT_RECIPIENT
+    amount_str = DEFAULT_AMOUNT
+
+    if interactive:
+        # Get recipient address
+        print("\n📮 Enter recipient address")
+        print(f"   (Press Enter for default: {DEFAULT_RECIPIENT})")
+        print("   > ", end="")
+        to_address = input().strip() or DEFAULT_RECIPIENT
+
+        # Get amount
+        print("\n💰 Enter amount of KAIA to send")
+        print(f"   (Press Enter for default: {DEFAULT_AMOUNT} KAIA)")
+        print("   > ", end="")
+        amount_str = input().strip() or DEFAULT_AMOUNT
 
+    return to_address, amount_str
+
+
+def create_transaction(to_address: str, amount_str: str) -> Dict[str, Any]:
+    """Create a new transaction proposal"""
     # Convert to wei
     amount_wei = str(int(float(amount_str) * 10**18))
 
@@ -107,7 +186,7 @@ def create_transaction() -> Dict[str, Any]:
     print(f"   To: {to_address}")
     print(f"   Amount: {amount_str} KAIA")
 
-    response = requests.post(
+    response = SESSION.post(
         f"{API_URL}/transactions",
         json={
             "to": to_address,
@@ -119,7 +198,7 @@ def create_transaction() -> Dict[str, Any]:
     if response.status_code != 200:
         raise Exception(f"Failed to create transaction: {response.text}")
 
-    result = response.json()
+    result = _json_body(response, required=True)
     print("\n✅ Transaction created successfully!")
     print(f"   TX ID: {result['tx_id']}")
     print(f"   Safe TX Hash: {result['safe_tx_hash'][:10]}...")
@@ -127,14 +206,42 @@ def create_transaction() -> Dict[str, Any]:
     return result
 
 
-def sign_message_with_key(message_hash: str, private_key: str) -> str:
-    """Sign a message hash with a private key for Safe transactions"""
-    from eth_utils import keccak
-    from web3 import Web3
+def _is_json(response, required: bool = False) -> bool:
+    """Check a requests or aiohttp response for a JSON body, raising if a required one is missing"""
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        return True
+    if required:
+        raise Exception(
+            f"Unexpected response from {response.url}: expected JSON, got {content_type or 'no content type'}"
+        )
+    return False
 
-    # Debug: Print the hash we received
-    print(
-        f"   Debug - Received hash: {message_hash[:70]}... (length: {len(message_hash)})"
+
+def _json_body(response: requests.Response, required: bool = False) -> Dict[str, Any]:
+    """Decode a JSON response body once, or return {} when it is not JSON and not required"""
+    if not _is_json(response, required):
+        return {}
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def _json_body_async(
+    response: aiohttp.ClientResponse, required: bool = False
+) -> Dict[str, Any]:
+    """Async variant of _json_body"""
+    if not _is_json(response, required):
+        return {}
+    if orjson is not None:
+        return orjson.loads(await response.read())
+    return await response.json()
+
+
+def _decode_safe_hash(message_hash: str) -> bytes:
+    """Validate a Safe transaction hash and convert it to its 32 raw bytes"""
+    log.debug(
+        "   🔍 Received hash: %s... (length: %d)", message_hash[:70], len(message_hash)
     )
 
     # Safe transaction hash should be exactly 66 characters (0x + 64 hex chars)
@@ -143,12 +250,15 @@ def sign_message_with_key(message_hash: str, private_key: str) -> str:
         message_bytes = bytes.fromhex(message_hash[2:])
     else:
         # Something is wrong - log for debugging
-        print(
-            f"   WARNING: Unexpected hash format! Expected 66 chars, got {len(message_hash)}"
+        log.warning(
+            "   ⚠️  Unexpected hash format! Expected 66 chars, got %d",
+            len(message_hash),
         )
         # For now, handle it as before
         if len(message_hash) > 66:
             # This shouldn't happen for Safe tx hash
+            from eth_utils import keccak
+
             message_bytes = keccak(
                 message_hash.encode() if isinstance(message_hash, str) else message_hash
             )
@@ -162,95 +272,340 @@ def sign_message_with_key(message_hash: str, private_key: str) -> str:
     if len(message_bytes) != 32:
         raise ValueError(f"Hash must be exactly 32 bytes, got {len(message_bytes)}")
 
-    # Use eth_account's signing method
-    w3 = Web3()
-    account = w3.eth.account.from_key(private_key)
+    return message_bytes
 
-    # Sign the hash directly (without ethereum message prefix)
-    from eth_account import Account
 
-    # Create the signature
-    signature = Account._sign_hash(message_bytes, private_key)
+@functools.lru_cache(maxsize=256)
+def _curve_key_for(private_key: bytes) -> "coincurve.PrivateKey":
+    """Build the coincurve key for a private key, reusing earlier ones"""
+    return coincurve.PrivateKey(private_key)
 
-    # Return the signature for Safe (r + s + v format)
-    # Safe expects v to be 27 or 28 for EOA signatures
-    sig_hex = (
-        signature.r.to_bytes(32, "big")
-        + signature.s.to_bytes(32, "big")
-        + bytes([signature.v])
-    )
 
-    return "0x" + sig_hex.hex()
+def sign_hash_bytes(message_bytes: bytes, account: LocalAccount) -> str:
+    """Sign a decoded 32-byte hash with a signer's account for Safe transactions"""
+    if coincurve is not None:
+        # r + s + recovery id; Safe expects v = recovery id + 27 for EOA signatures
+        signature = _curve_key_for(account.key).sign_recoverable(
+            message_bytes, hasher=None
+        )
+        return "0x" + signature[:64].hex() + f"{signature[64] + 27:02x}"
 
+    # Sign the hash directly (without ethereum message prefix)
+    signature = account.unsafe_sign_hash(message_bytes)
 
-def submit_signature(
-    tx_id: str,
-    signer_name: str,
-    signer_info: Dict[str, str],
-    tx_hash: str,
-    signatures_count: int,
+    # Return the signature for Safe (r + s + v format)
+    # Safe expects v to be 27 or 28 for EOA signatures, which eth_account already
+    # packs into the 65-byte signature
+    return "0x" + signature.signature.hex()
+
+
+def analysis_lines(signer_name: str) -> List[str]:
+    """Return the simulated analysis result of an AI agent"""
+    if "CFO" in signer_name:
+        return [
+            "   💰 Financial rules verification: ✅ 1 KAIA - within daily limit",
+            "   📊 Budget compliance: ✅ Within test limits",
+        ]
+    if "Security" in signer_name:
+        return [
+            "   🔒 Recipient address verification: ✅ Not blacklisted",
+            "   ⚠️  Risk assessment: Low",
+        ]
+    if "Analyst" in signer_name:
+        return [
+            "   📈 Transaction analysis: Simple transfer",
+            "   🔍 Contract risk: None",
+        ]
+    return []
+
+
+def confirm_signature(
+    signer: Signer, signatures_count: int, demo_pace: float = 0.0
 ) -> bool:
-    """Submit a signature to the orchestrator with interactive confirmation"""
+    """Show a signer's analysis and ask for interactive confirmation"""
 
     print(f"\n{'=' * 50}")
-    print(f"🔐 {signer_name} ({signer_info['type'].replace('_', ' ').title()})")
+    print(f"🔐 {signer.name} ({signer.type.replace('_', ' ').title()})")
     print(f"{'=' * 50}")
-    print(f"📍 Address: {signer_info['address']}")
-    print(f"📊 Current signatures: {signatures_count}/5")
+    print(f"📍 Address: {signer.address}")
+    print(f"📊 Current approvals: {signatures_count}/{len(SIGNER_SPECS)}")
 
     # AI agents can analyze the transaction
-    if signer_info["type"] == "ai_agent":
-        print(f"\n🤖 {signer_name} analyzing...")
-        time.sleep(0.5)  # Simulate analysis time
-
-        if "CFO" in signer_name:
-            print("   💰 Financial rules verification: ✅ 1 KAIA - within daily limit")
-            print("   📊 Budget compliance: ✅ Within test limits")
-        elif "Security" in signer_name:
-            print("   🔒 Recipient address verification: ✅ Not blacklisted")
-            print("   ⚠️  Risk assessment: Low")
-        elif "Analyst" in signer_name:
-            print("   📈 Transaction analysis: Simple transfer")
-            print("   🔍 Contract risk: None")
+    if signer.type == "ai_agent":
+        print(f"\n🤖 {signer.name} analyzing...")
+        if demo_pace:
+            time.sleep(demo_pace)  # Simulate analysis time
+        # Printed rather than logged: the human reads this before answering
+        for line in analysis_lines(signer.name):
+            print(line)
 
     # Ask for confirmation
-    print(f"\n❓ Sign with {signer_name}? (y/n): ", end="")
+    print(f"\n❓ Sign with {signer.name}? (y/n): ", end="")
     response = input().strip().lower()
 
     if response != "y":
-        print(f"   ⏭️  Skipped {signer_name} signature")
+        print(f"   ⏭️  Skipped {signer.name} signature")
         print()
         return False
 
-    print("\n🖊️  Signing...")
-    # All signers provide their own signatures
-    signature = sign_message_with_key(tx_hash, signer_info["private_key"])
+    return True
 
-    response = requests.post(
+
+def compute_signatures(message_bytes: bytes, signers: Sequence[Signer]) -> List[str]:
+    """Sign the hash for every signer up front, before any request is sent"""
+    # Each signature takes microseconds and holds the GIL, so a thread pool
+    # only adds startup overhead
+    return [sign_hash_bytes(message_bytes, signer.account) for signer in signers]
+
+
+def _post_signatures(
+    url: str, payload: Dict[str, Any], attempts: int = 3
+) -> requests.Response:
+    """POST already computed signatures, retrying transient failures without re-signing"""
+    # The session's Retry covers connection errors but not POST responses; resending
+    # a signature is safe because the orchestrator rejects duplicates per signer
+    for attempt in range(1, attempts + 1):
+        response = SESSION.post(url, json=payload)
+        if response.status_code not in RETRY_STATUSES or attempt == attempts:
+            return response
+        time.sleep(0.1 * 2 ** (attempt - 1))
+
+
+def post_signature(
+    tx_id: str, signer: Signer, signature: str
+) -> Optional[Dict[str, Any]]:
+    """Submit a single signature to the orchestrator, returning the response if it was accepted"""
+    response = _post_signatures(
         f"{API_URL}/transactions/{tx_id}/sign",
-        json={"signer_address": signer_info["address"], "signature": signature},
+        {"signer_address": signer.address, "signature": signature},
     )
 
     if response.status_code == 200:
-        result = response.json()
-        if "success" in result and result["success"]:
-            print(
-                f"   ✅ Signature complete! (Total {result['current_signatures']}/{result['required_signatures']} signatures collected)"
+        result = _json_body(response)
+        if result.get("success"):
+            log.info(
+                "   ✅ %s signed! (Total %s/%s signatures collected)",
+                signer.name,
+                result["current_signatures"],
+                result["required_signatures"],
             )
-            return True
+            return result
         else:
-            print(f"   ❌ Signature failed: {result.get('error', 'Unknown error')}")
+            log.warning(
+                "   ❌ %s signature failed: %s",
+                signer.name,
+                result.get("error", "Unknown error"),
+            )
     else:
-        print(f"   ❌ Request failed: {response.status_code}")
+        log.warning("   ❌ %s request failed: %s", signer.name, response.status_code)
 
-    return False
+    return None
 
 
-def check_status(tx_id: str):
-    """Check transaction status"""
-    response = requests.get(f"{API_URL}/transactions/{tx_id}/status")
-    if response.status_code == 200:
-        status = response.json()
+def submit_signatures_batch(
+    tx_id: str, entries: List[Dict[str, str]]
+) -> Optional[Dict[str, Any]]:
+    """Submit several signatures in one request, or None if the server lacks the batch route"""
+    response = _post_signatures(
+        f"{API_URL}/transactions/{tx_id}/sign_batch", {"signatures": entries}
+    )
+
+    if response.status_code in (404, 405):
+        return None
+    if response.status_code != 200:
+        raise Exception(f"Failed to submit signatures: {response.text}")
+
+    return _json_body(response, required=True)
+
+
+def sign_and_submit(
+    tx_id: str, message_bytes: bytes, confirmed: List[Signer]
+) -> Optional[Dict[str, Any]]:
+    """Sign for every confirmed signer and submit in one batch, returning the latest sign response"""
+    if not confirmed:
+        return None
+
+    log.info("\n🖊️  Signing...")
+    # All signers provide their own signatures, computed locally before any request
+    signatures = compute_signatures(message_bytes, confirmed)
+
+    result = submit_signatures_batch(
+        tx_id,
+        [
+            {"signer_address": signer.address, "signature": signature}
+            for signer, signature in zip(confirmed, signatures)
+        ],
+    )
+
+    if result is None:
+        # Older orchestrator without the batch route, so post each signature in parallel
+        with ThreadPoolExecutor(max_workers=len(confirmed)) as pool:
+            futures = [
+                pool.submit(post_signature, tx_id, signer, signature)
+                for signer, signature in zip(confirmed, signatures)
+            ]
+            results = [future.result() for future in as_completed(futures)]
+        return latest_sign_response(results)
+
+    report_batch_result(confirmed, result)
+    return result
+
+
+def report_batch_result(signers: Sequence[Signer], result: Dict[str, Any]):
+    """Log the per-signer outcome of a batch submission"""
+    for signer, entry in zip(signers, result["results"]):
+        if entry.get("success"):
+            log.info("   ✅ %s signed!", signer.name)
+        else:
+            log.warning(
+                "   ❌ %s signature failed: %s",
+                signer.name,
+                entry.get("error", "Unknown error"),
+            )
+
+    log.info(
+        "   ✅ Signatures submitted! (Total %s/%s signatures collected)",
+        result["current_signatures"],
+        result["required_signatures"],
+    )
+
+
+def latest_sign_response(
+    results: Sequence[Optional[Dict[str, Any]]],
+) -> Optional[Dict[str, Any]]:
+    """Pick the accepted sign response with the most signatures, which is the latest state"""
+    accepted = [result for result in results if result]
+    if not accepted:
+        return None
+    # Signature counts only grow, so the fullest response is the latest state
+    return max(accepted, key=lambda result: result["current_signatures"])
+
+
+async def analyze_async(signer: Signer, demo_pace: float = 0.0):
+    """Run an AI agent's simulated analysis without blocking the other signers"""
+    if signer.type == "ai_agent":
+        if demo_pace:
+            await asyncio.sleep(demo_pace)  # Simulate analysis time
+        log.info("\n🤖 %s analysis:", signer.name)
+        for line in analysis_lines(signer.name):
+            log.info("%s", line)
+
+
+async def submit_signatures_batch_async(
+    session: aiohttp.ClientSession, tx_id: str, entries: List[Dict[str, str]]
+) -> Optional[Dict[str, Any]]:
+    """Async variant of submit_signatures_batch"""
+    async with session.post(
+        f"{API_URL}/transactions/{tx_id}/sign_batch",
+        json={"signatures": entries},
+    ) as response:
+        if response.status in (404, 405):
+            return None
+        if response.status != 200:
+            raise Exception(f"Failed to submit signatures: {await response.text()}")
+        return await _json_body_async(response, required=True)
+
+
+async def post_signature_async(
+    session: aiohttp.ClientSession, tx_id: str, signer: Signer, signature: str
+) -> Optional[Dict[str, Any]]:
+    """Async variant of post_signature"""
+    async with session.post(
+        f"{API_URL}/transactions/{tx_id}/sign",
+        json={"signer_address": signer.address, "signature": signature},
+    ) as response:
+        if response.status != 200:
+            log.warning("   ❌ %s request failed: %s", signer.name, response.status)
+            return None
+        result = await _json_body_async(response)
+
+    if result.get("success"):
+        log.info(
+            "   ✅ %s signed! (Total %s/%s signatures collected)",
+            signer.name,
+            result["current_signatures"],
+            result["required_signatures"],
+        )
+        return result
+
+    log.warning(
+        "   ❌ %s signature failed: %s",
+        signer.name,
+        result.get("error", "Unknown error"),
+    )
+    return None
+
+
+async def _bounded(semaphore: asyncio.Semaphore, awaitable):
+    """Await a request while holding one of the semaphore's slots"""
+    async with semaphore:
+        return await awaitable
+
+
+async def collect_signatures_async(
+    tx_id: str,
+    message_bytes: bytes,
+    signers: Sequence[Signer],
+    demo_pace: float = 0.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Optional[Dict[str, Any]]:
+    """Analyze concurrently, then sign and submit in batches, returning the latest batch response"""
+    await asyncio.gather(*[analyze_async(signer, demo_pace) for signer in signers])
+
+    signatures = compute_signatures(message_bytes, signers)
+    pairs = list(zip(signers, signatures))
+    batches = [pairs[i : i + batch_size] for i in range(0, len(pairs), batch_size)]
+
+    # At most `concurrency` requests in flight, over as many pooled connections
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *[
+                _bounded(
+                    semaphore,
+                    submit_signatures_batch_async(
+                        session,
+                        tx_id,
+                        [
+                            {"signer_address": signer.address, "signature": signature}
+                            for signer, signature in batch
+                        ],
+                    ),
+                )
+                for batch in batches
+            ]
+        )
+
+        if not results or results[0] is None:
+            # Older orchestrator without the batch route
+            fallback_results = await asyncio.gather(
+                *[
+                    _bounded(
+                        semaphore,
+                        post_signature_async(session, tx_id, signer, signature),
+                    )
+                    for signer, signature in pairs
+                ]
+            )
+            return latest_sign_response(fallback_results)
+
+    for batch, result in zip(batches, results):
+        report_batch_result([signer for signer, _ in batch], result)
+
+    return latest_sign_response(results)
+
+
+def check_status(tx_id: str, last_sign_response: Optional[Dict[str, Any]] = None):
+    """Check transaction status, reusing the last sign response when it carries it"""
+    if last_sign_response and all(key in last_sign_response for key in STATUS_KEYS):
+        status = last_sign_response
+    else:
+        response = SESSION.get(f"{API_URL}/transactions/{tx_id}/status")
+        status = _json_body(response) if response.status_code == 200 else None
+
+    if status:
         print("📊 Transaction Status:")
         print(
             f"   Signatures collected: {status['signatures_collected']}/{status['required_signatures']}"
@@ -258,9 +613,9 @@ def check_status(tx_id: str):
         print(f"   Status: {status['status']}")
 
         if status["signers"]:
-            print("   Signers:")
+            log.info("   Signers:")
             for signer in status["signers"]:
-                print(f"     - {signer['address']} ({signer['type']})")
+                log.info("     - %s (%s)", signer["address"], signer["type"])
         print()
         return status
     return None
@@ -270,10 +625,10 @@ def execute_transaction(tx_id: str):
     """Execute the transaction after collecting enough signatures"""
     print("🚀 Executing transaction...")
 
-    response = requests.post(f"{API_URL}/transactions/{tx_id}/execute")
+    response = SESSION.post(f"{API_URL}/transactions/{tx_id}/execute")
+    result = _json_body(response)
     if response.status_code == 200:
-        result = response.json()
-        if result["success"]:
+        if result.get("success"):
             print("✅ Transaction executed successfully!")
             print(f"   Transaction hash: {result['tx_hash']}")
         else:
@@ -281,34 +636,73 @@ def execute_transaction(tx_id: str):
     else:
         print(f"❌ Request failed: {response.status_code}")
 
-    return response.json()
+    return result
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="use default transaction values and sign with all signers concurrently",
+    )
+    parser.add_argument(
+        "--demo-pace",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="simulated AI agent analysis time for demo effect (default: 0)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"max in-flight requests in non-interactive mode (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"signatures per sign_batch request in non-interactive mode (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="only log warnings and errors (default when stdout is not a terminal)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1 or args.batch_size < 1:
+        parser.error("--concurrency and --batch-size must be at least 1")
+
+    log_level = os.getenv("LOG_LEVEL", "").upper()
+    if log_level and log_level not in logging.getLevelNamesMapping():
+        parser.error(f"unknown LOG_LEVEL {os.getenv('LOG_LEVEL')!r}")
+
+    return args
+
+
+def main(argv=None):
     """Main demo flow"""
+    args = parse_args(argv)
+    # Per-signer output goes through logging so it is never formatted when
+    # quiet; LOG_LEVEL still overrides the non-terminal default
+    if args.quiet:
+        level = "WARNING"
+    else:
+        level = os.getenv("LOG_LEVEL") or ("INFO" if sys.stdout.isatty() else "WARNING")
+    logging.basicConfig(stream=sys.stdout, level=level.upper(), format="%(message)s")
+
     print("=" * 60)
     print("🔐 Sentinel Safe Wallet - Private Key Signing Demo")
     print("=" * 60)
     print()
 
-    # Check if keys are loaded
-    if not DEMO_SIGNERS:
-        print("❌ Error: No private keys found in environment variables!")
-        print()
-        print("Please create a .env file with the following keys:")
-        print("  HUMAN1_PRIVATE_KEY=0x...")
-        print("  HUMAN2_PRIVATE_KEY=0x...")
-        print("  AI_CFO_PRIVATE_KEY=0x...")
-        print("  AI_SECURITY_PRIVATE_KEY=0x...")
-        print("  AI_ANALYST_PRIVATE_KEY=0x...")
+    if args.demo_pace:
+        print(f"⏱️  Demo pacing: {args.demo_pace}s per AI agent analysis")
         print()
-        print("For testing, you can use test keys from Hardhat/Anvil")
-        return 1
-
-    print(f"✅ Loaded {len(DEMO_SIGNERS)} signers from environment")
-    for name, info in DEMO_SIGNERS.items():
-        print(f"   - {name}: {info['address']}")
-    print()
 
     # Note about security
     print("⚠️  SECURITY NOTE:")
@@ -320,70 +714,88 @@ def main():
     print("=" * 60)
     print()
 
+    # Derive signer accounts in the background while transaction details are
+    # entered; the result is awaited before the first request so a bad key
+    # still fails before anything is sent to the orchestrator
+    loader = ThreadPoolExecutor(max_workers=1)
+    signers_future = loader.submit(_bootstrap)
+    loader.shutdown(wait=False)
+
     try:
         # 1. Create transaction
-        tx_result = create_transaction()
+        to_address, amount_str = prompt_transaction_details(
+            interactive=not args.non_interactive
+        )
+        signers = signers_future.result()
+        print(f"\n✅ Loaded {len(signers)} signers from environment")
+        for signer in signers:
+            log.info("   - %s: %s", signer.name, signer.address)
+
+        tx_result = create_transaction(to_address, amount_str)
         tx_id = tx_result["tx_id"]
         tx_hash = tx_result["safe_tx_hash"]
+        # The hash is the same for every signer, so decode it only once
+        message_bytes = _decode_safe_hash(tx_hash)
 
         # 2. Collect signatures from all signers interactively
-        signers_list = list(DEMO_SIGNERS.items())
-
-        if len(signers_list) < 4:
-            print(
-                f"❌ Error: Need at least 4 signers, but only {len(signers_list)} found"
-            )
-            return 1
-
         print("\n" + "=" * 60)
-        print("📝 Starting signature collection (minimum 4/5 required)")
+        print(
+            f"📝 Starting signature collection (minimum {MIN_SIGNERS}/{len(SIGNER_SPECS)} required)"
+        )
         print("=" * 60)
 
-        signatures_collected = 0
-        signed_addresses = set()
-
-        # Go through all 5 signers
-        for signer_name, signer_info in signers_list:
-            # Skip if already signed
-            if signer_info["address"] in signed_addresses:
-                continue
-
-            # Submit signature with current count
-            if submit_signature(
-                tx_id, signer_name, signer_info, tx_hash, signatures_collected
-            ):
-                signatures_collected += 1
-                signed_addresses.add(signer_info["address"])
-
-                # Check if we have enough signatures
-                if signatures_collected >= 4:
-                    print(
-                        f"\n🎉 Sufficient signatures collected! ({signatures_collected}/5)"
+        confirmed = []
+
+        if args.non_interactive:
+            # Analyze, sign and submit for all signers without prompts, on
+            # uvloop when it is installed
+            loop_factory = uvloop.new_event_loop if uvloop is not None else None
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                last_sign_response = runner.run(
+                    collect_signatures_async(
+                        tx_id,
+                        message_bytes,
+                        signers,
+                        args.demo_pace,
+                        args.concurrency,
+                        args.batch_size,
                     )
-
-                    # Ask if they want to continue with the 5th signer
-                    if (
-                        signatures_collected < 5
-                        and (
-                            len(signers_list)
-                            - signers_list.index((signer_name, signer_info))
-                            - 1
+                )
+        else:
+            # Go through every loaded signer
+            for idx, signer in enumerate(signers):
+                # Ask for approval with current count
+                if confirm_signature(signer, len(confirmed), args.demo_pace):
+                    confirmed.append(signer)
+
+                    # Check if we have enough approvals
+                    if len(confirmed) >= MIN_SIGNERS:
+                        print(
+                            f"\n🎉 Sufficient approvals collected! ({len(confirmed)}/{len(SIGNER_SPECS)})"
                         )
-                        > 0
-                    ):
-                        print("\n❓ Collect additional signatures? (y/n): ", end="")
-                        continue_signing = input().strip().lower()
-                        if continue_signing != "y":
-                            break
+
+                        # Ask if they want to continue with the remaining signers
+                        remaining = len(signers) - idx - 1
+                        if remaining > 0:
+                            print("\n❓ Collect additional signatures? (y/n): ", end="")
+                            continue_signing = input().strip().lower()
+                            if continue_signing != "y":
+                                break
+
+            # Sign locally and submit every approved signature at once
+            last_sign_response = sign_and_submit(tx_id, message_bytes, confirmed)
 
         print("\n" + "=" * 60)
         # 3. Check final status
-        status = check_status(tx_id)
+        status = check_status(tx_id, last_sign_response=last_sign_response)
 
         # 4. Execute transaction if we have enough signatures
-        if status and status["signatures_collected"] >= 4:
-            print("\n❓ Execute the transaction? (y/n): ", end="")
-            execute_response = input().strip().lower()
+        if status and status["signatures_collected"] >= MIN_SIGNERS:
+            if args.non_interactive:
+                execute_response = "y"
+            else:
+                print("\n❓ Execute the transaction? (y/n): ", end="")
+                execute_response = input().strip().lower()
 
             if execute_response == "y":
                 execute_result = execute_transaction(tx_id)
@@ -391,7 +803,7 @@ def main():
                 print("⏸️  Transaction execution deferred")
         else:
             print(
-                f"\n❌ Cannot execute due to insufficient signatures ({status['signatures_collected']}/4 required)"
+                f"\n❌ Cannot execute due to insufficient signatures ({status['signatures_collected']}/{MIN_SIGNERS} required)"
             )
 
         print()